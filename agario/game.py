@@ -1,13 +1,14 @@
 import abc
 import asyncio
 import enum
-import random
 import time
 import traceback
 import collections
+import numpy as np
 from .terminal import Terminal, Color, Renderable, Size, \
-        Vector2, Dir, Shape, MouseKey
+        Vector2, Rect, Dir, Shape, MouseKey
 from .exceptions import StatusCode, GameExit
+from ._fastmath import _collide_scalar
 from .logger import create_logger
 
 
@@ -19,8 +20,12 @@ FPS = 40 # Game FPS (Frame Per Second)
 
 FRAME_SEC = 1 / 40 # Second per frame
 
+FRAME_NS = 1000000000 // FPS # Nanosecond per frame
+
 logger = create_logger(__name__) # Logger for Game
 
+ENEMY_SHAPE = Shape.Bullet.value # Character drawn for enemies
+
 
 class CollisionState(enum.Enum):
     NotCollided = 0
@@ -47,6 +52,20 @@ class Game:
             count=300,
             rect=self.terminal.map.boundary
         )
+        # Enemy positions and sizes as parallel arrays, indexed like
+        # `enemy_objs`, so that the collision scan is vectorized.
+        self.enemy_objs = list(self.enemies)
+        n = len(self.enemy_objs)
+        self.enemy_x = np.empty(n, np.int32)
+        self.enemy_y = np.empty(n, np.int32)
+        self.enemy_sz = np.empty(n, np.int32)
+        self.enemy_alive = np.ones(n, np.bool_)
+        for i, enemy in enumerate(self.enemy_objs):
+            self.enemy_x[i] = enemy.get_pos().x
+            self.enemy_y[i] = enemy.get_pos().y
+            self.enemy_sz[i] = enemy.get_width()
+        self.colliding = []
+        self._pending_removals = set()
 
         # fix me
         self.login(Player(x=10, y=10))
@@ -56,11 +75,22 @@ class Game:
         Game loop.
         """
         try:
+            deadline = time.monotonic_ns()
             while True:
                 now = time.time() * 1000
 
                 self.update(now)
-                time.sleep(FRAME_SEC)
+
+                # Sleep until the next frame boundary, not a fixed
+                # FRAME_SEC, so that time spent in update() is accounted.
+                deadline += FRAME_NS
+                sleep_ns = deadline - time.monotonic_ns()
+                if sleep_ns > 0:
+                    time.sleep(sleep_ns / 1000000000)
+                else:
+                    # Running behind; drop the backlog instead of
+                    # rushing through frames to catch up.
+                    deadline = time.monotonic_ns()
 
         except GameExit as e:
             return StatusCode.GameExit
@@ -120,10 +150,13 @@ class Game:
         """
         Update that is called on every frame.
         """
-        self.enemies = [
-            enemy for enemy in self.enemies
-            if not enemy.being_destroyed
-        ]
+        if self._pending_removals:
+            pending = self._pending_removals
+            self.enemies = [
+                enemy for enemy in self.enemies
+                if enemy not in pending
+            ]
+            pending.clear()
         self.terminal.update(
             now,
             self.player,
@@ -135,30 +168,56 @@ class Game:
         """
         Update callisions on every frame.
         """
-        for enemy in self.enemies:
-            result = check_collision(self.player, enemy)
-            if result == CollisionState.Exited:
-                pass
-
-        logger.debug('t:{}'.format(self.player.make_trajectory()))
+        # Only enemies overlapping the player's trajectory can start
+        # colliding, and only those collided last frame can stop.
+        trajectory = self.player.make_trajectory()
+        center = trajectory.get_pos()
+        width = trajectory.get_width()
+        height = trajectory.get_height()
+        hits = (np.abs(self.enemy_x - center.x) < (self.enemy_sz + width) // 2)
+        hits &= (np.abs(self.enemy_y - center.y) < (self.enemy_sz + height) // 2)
+        hits &= self.enemy_alive
+
+        candidates = dict.fromkeys(np.nonzero(hits)[0].tolist())
+        candidates.update(dict.fromkeys(self.colliding))
+        self.colliding = []
+        for i in candidates:
+            enemy = self.enemy_objs[i]
+            result = check_collision(self.player, enemy, trajectory)
+            if enemy.being_destroyed:
+                self.enemy_alive[i] = False
+                self._pending_removals.add(enemy)
+            elif result in (CollisionState.Entered,
+                            CollisionState.BeingCollided):
+                self.colliding.append(i)
+
+        # Nothing `reach` or further away on X can collide, so skip the
+        # full check for such players unless they still need an exit.
+        reach = (width + Size.MaxSize.value) >> 1
+        collisions = self.player.collisions
         for other in self.other_players:
-            check_collision(self.player, other)
+            if abs(other.get_pos().x - center.x) >= reach and \
+                id(other) not in collisions:
+                continue
+            check_collision(self.player, other, trajectory)
 
 
-def check_collision(player, other):
+def check_collision(player, other, trajectory=None):
     result = CollisionState.NotCollided
+    if trajectory is None:
+        trajectory = player.make_trajectory()
 
-    was_being_collided = player.collisions.get(id(other))
-    being_collided = collide(player.make_trajectory(), other)
+    was_being_collided = id(other) in player.collisions
+    being_collided = collide(trajectory, other)
 
     if not was_being_collided and being_collided:
-        player.collisions.update({id(other): being_collided})
+        player.collisions.add(id(other))
         player.on_collision_entered(Collision(other))
         other.on_collision_entered(Collision(player))
         result = CollisionState.Entered
 
     elif was_being_collided and not being_collided:
-        player.collisions.update({id(other): being_collided})
+        player.collisions.discard(id(other))
         player.on_collision_exited(Collision(other))
         other.on_collision_exited(Collision(player))
         result = CollisionState.Exited
@@ -178,15 +237,10 @@ def collide(lhs, rhs):
     if not pos1 or not pos2:
         return False
 
-    xdistance = abs(pos1.x - pos2.x)
-    width = int((lhs.get_width() + rhs.get_width()) / 2)
-
-    ydistance = abs(pos1.y - pos2.y)
-    height = int((lhs.get_height() + rhs.get_height()) / 2)
-    if xdistance < width and ydistance < height:
-        return True
-
-    return False
+    return _collide_scalar(
+        pos1.x, pos1.y, lhs.get_width(), lhs.get_height(),
+        pos2.x, pos2.y, rhs.get_width(), rhs.get_height(),
+    )
 
 
 Collision = collections.namedtuple('Collision', ['other'])
@@ -199,24 +253,38 @@ class GameObject(Renderable):
     def __init__(self, x=None, y=None):
         Renderable.__init__(self)
         self.pos = Vector2(x, y)
-        self.size = Size.w1xh1
-        self.collisions = {}
+        self.set_size(Size.w1xh1)
+        self.collisions = set()
         self.being_destroyed = False
 
     def get_width(self):
-        return self.size.value
+        return self._size_int
 
     def get_height(self):
-        return self.size.value
+        return self._size_int
 
     def get_size(self) -> Size:
         return self.size
 
     def set_size(self, size):
+        self._traj_cache = None
         if isinstance(size, Size):
             self.size = size
         else:
             self.size = Size(size)
+        # Plain ints so that the hot paths skip IntEnum lookups.
+        self._size_int = int(self.size)
+        self._half = self._size_int >> 1
+
+    def get_rect(self):
+        pos = self.pos
+        half = self._half
+        return Rect(
+            x1=pos.x - half,
+            y1=pos.y - half,
+            x2=pos.x + half,
+            y2=pos.y + half,
+        )
 
     def get_pos(self):
         return self.pos
@@ -232,14 +300,14 @@ class GameObject(Renderable):
 
     def expand(self):
         value = min(
-            self.get_size().value + 2,
+            self._size_int + 2,
             Size.MaxSize.value
         )
         self.set_size(value)
 
     def shrink(self):
         value = max(
-            self.get_size().value - 2,
+            self._size_int - 2,
             Size.MinSize.value
         )
         self.set_size(value)
@@ -254,13 +322,12 @@ class Player(GameObject):
         self.set_color(Color.Red, Color.Red)
 
     def on_collision_entered(self, collision):
-        logger.debug('{} collided with {}!'.format(self, collision.other))
+        logger.debug('%s collided with %s!', self, collision.other)
         self.set_color(Color.Green, Color.Green)
         self.expand()
 
     def on_collision_exited(self, collision):
-        msg = '{} not collided anymore with {}!'.format(self, collision.other)
-        logger.debug(msg)
+        logger.debug('%s not collided anymore with %s!', self, collision.other)
         self.set_color(Color.Red, Color.Red)
 
     def __repr__(self):
@@ -276,16 +343,15 @@ class Enemy(GameObject):
     """
     def __init__(self, x, y):
         GameObject.__init__(self, x=x, y=y)
-        self.size = Size.w1xh1
-        self.set_color(Color.Random)
+        self.set_size(Size.w1xh1)
+        self.set_color(Color.random_color())
 
     def on_collision_entered(self, collision):
-        logger.debug('{} collided with {}!'.format(self, collision.other))
+        logger.debug('%s collided with %s!', self, collision.other)
         self.set_color(Color.Green)
 
     def on_collision_exited(self, collision):
-        msg = '{} not collided anymore with {}!'.format(self, collision.other)
-        logger.debug(msg)
+        logger.debug('%s not collided anymore with %s!', self, collision.other)
         self.set_color(Color.Blue)
         self.destroy()
 
@@ -296,26 +362,20 @@ class Enemy(GameObject):
         )
 
     def get_shape(self):
-        return Shape.Bullet.value
+        return ENEMY_SHAPE
 
 
 def spawn_enemies(count=10, rect=None, randomness=True):
     """
     Spawn enemies.
     """
-    logger.debug('{}'.format(rect))
-    logger.debug('{} {} {} {}'.format(
-        rect.x1,
-        rect.x2,
-        rect.y1,
-        rect.y2
-    ))
+    logger.debug('%s', rect)
+    logger.debug('%s %s %s %s', rect.x1, rect.x2, rect.y1, rect.y2)
+    xs = np.random.randint(rect.x1, rect.x2, size=count)
+    ys = np.random.randint(rect.y1, rect.y2, size=count)
     enemies = [
-        Enemy(
-            x=random.randint(rect.x1, rect.x2-1),
-            y=random.randint(rect.y1, rect.y2-1)
-        )
-        for n in range(0, count)
+        Enemy(x=x, y=y)
+        for x, y in zip(xs.tolist(), ys.tolist())
     ]
     for e in enemies:
         if not e.get_pos():
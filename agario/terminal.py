@@ -1,9 +1,9 @@
 import abc
-import copy
 import enum
 import traceback
 import random
 import os
+import numpy as np
 from termbox import *
 from .logger import create_logger
 
@@ -26,6 +26,8 @@ DEFAULT_SQUARE = 0x0020
 
 DEFAULT_COLOR = DEFAULT
 
+BLANK_CELL = (DEFAULT_SQUARE, DEFAULT_COLOR, DEFAULT_COLOR)
+
 logger = create_logger(__name__)
 
 
@@ -46,7 +48,13 @@ class Color(enum.IntEnum):
 
     @classmethod
     def random_color(cls):
-        return random.randint(cls.Default, cls.Random-1)
+        return random.randint(RANDOM_COLOR_MIN, RANDOM_COLOR_MAX)
+
+
+# Plain int bounds so random_color() skips IntEnum arithmetic.
+RANDOM_COLOR_MIN = int(Color.Default)
+
+RANDOM_COLOR_MAX = int(Color.Random) - 1
 
 
 class Shape(enum.Enum):
@@ -59,6 +67,8 @@ class Shape(enum.Enum):
 
 
 class Vector2:
+    __slots__ = ('x', 'y')
+
     def __init__(self, x=None, y=None):
         self.x = x
         self.y = y
@@ -93,10 +103,21 @@ class Dir(enum.Enum):
     Down = Vector2(0, 1)
 
 
+# (dx1, dy1, dx2, dy2) stretching a rect back over the cells it just left.
+TRAJECTORY_DELTA = {
+    Dir.Left: (0, 0, -Dir.Left.value.x, 0),
+    Dir.Right: (-Dir.Right.value.x, 0, 0, 0),
+    Dir.Up: (0, 0, 0, -Dir.Up.value.y),
+    Dir.Down: (0, -Dir.Down.value.y, 0, 0),
+}
+
+
 class Rect:
     """
     Rectangle.
     """
+    __slots__ = ('x1', 'y1', 'x2', 'y2')
+
     def __init__(self, x1=0, y1=0, x2=0, y2=0):
         self.x1 = x1
         self.y1 = y1
@@ -136,8 +157,8 @@ class Rect:
 
     def get_center(self):
         return Vector2(
-            self.x1 + (self.x2 - self.x1),
-            self.y1 + (self.y2 - self.y1)
+            self.x1 + int((self.x2 - self.x1) / 2),
+            self.y1 + int((self.y2 - self.y1) / 2)
         )
 
     def get_width(self):
@@ -161,6 +182,8 @@ class Cell:
     """
     Cell.
     """
+    __slots__ = ('x', 'y', 'fg', 'bg', 'c')
+
     def __init__(self, x=None, y=None, fg=None, bg=None, c=None):
         self.c = c or Shape.Default.value
         self.x = x
@@ -214,7 +237,7 @@ def render(tm, cells):
     if not tm.tb:
         raise RuntimeError('Null termbox')
     for cell in cells:
-        tm.tb.change_cell(
+        tm.change_cell(
             cell.x,
             cell.y,
             cell.c,
@@ -223,6 +246,15 @@ def render(tm, cells):
         )
 
 
+def render_array(tm, cells):
+    """
+    Render an (N, 5) array of x, y, c, fg, bg rows
+    """
+    if not tm.tb:
+        raise RuntimeError('Null termbox')
+    tm.draw_array(cells)
+
+
 class Renderable:
     """
     Renderable interface.
@@ -236,6 +268,7 @@ class Renderable:
         self.bg = None
         self.prev_direction = None
         self.direction = None
+        self._traj_cache = None
 
     def render(self, tm=None, dx=0, dy=0, check_intersect=True):
         """
@@ -261,13 +294,18 @@ class Renderable:
             trajectory = rect
         if check_intersect and tm.map.intersectd_with(rect=trajectory):
             self.pos = self.prev_pos or self.pos
+            self._traj_cache = None
             self.render(tm, dx, dy, check_intersect=False)
 
+        if not tm.tb:
+            raise RuntimeError('Null termbox')
+        c = self.get_shape() or DEFAULT_SQUARE
+        fg = fg or DEFAULT_COLOR
+        bg = bg or DEFAULT_COLOR
+        for y in range(bottom-dy, top-dy+1):
+            tm.draw_hline(left-dx, right-dx, y, c, fg, bg)
+
         cells = []
-        for y in range(bottom, top+1):
-            for x in range(left, right+1):
-                cell = Cell(x=x-dx, y=y-dy, fg=fg, bg=bg, c=self.get_shape())
-                cells.append(cell)
         if tm.debug:
             x = right + 1
             y = bottom + 1
@@ -282,22 +320,22 @@ class Renderable:
         render(tm, cells)
 
     def move(self, direction: Dir=None, pos: Vector2=None):
+        self._traj_cache = None
         self.prev_direction = self.direction
         if direction:
             self.direction = direction
-            self.prev_pos = copy.deepcopy(self.pos)
+            self.prev_pos = Vector2(self.pos.x, self.pos.y)
             self.pos += direction.value
-            logger.debug('{} {} {} {}'.format(direction, direction.name, direction.value, self.pos))
+            logger.debug('%s %s %s %s', direction, direction.name, direction.value, self.pos)
         if pos:
-            self.prev_pos = copy.deepcopy(self.pos)
+            self.prev_pos = self.pos and Vector2(self.pos.x, self.pos.y)
             self.pos = pos
 
     def get_rect(self):
         pos = self.get_pos()
         size = self.get_size()
-        diameter = Vector2()
-        diameter.y = int((size - 1) / 2)
-        diameter.x = int((size - 1) / 2)
+        radius = int((size - 1) / 2)
+        diameter = Vector2(radius, radius)
         left = pos.x - diameter.x
         right = pos.x + diameter.x
         bottom = pos.y - diameter.y
@@ -311,37 +349,27 @@ class Renderable:
         return rect
 
     def make_trajectory(self, rect=None):
+        """
+        Make the rect swept by the last move. The result is cached until
+        the next move or resize unless `rect` is given.
+        """
+        if rect is None and self._traj_cache is not None:
+            return self._traj_cache
+        cache = rect is None
         rect = rect or self.get_rect()
-        if self.direction == Dir.Left:
-            trajectory = Rect(
-                x1=rect.x1,
-                y1=rect.y1,
-                x2=rect.x2-Dir.Left.value.x,
-                y2=rect.y2,
-            )
-        elif self.direction == Dir.Right:
-            trajectory = Rect(
-                x1=rect.x1-Dir.Right.value.x,
-                y1=rect.y1,
-                x2=rect.x2,
-                y2=rect.y2,
-            )
-        elif self.direction == Dir.Up:
-            trajectory = Rect(
-                x1=rect.x1,
-                y1=rect.y1-Dir.Up.value.y,
-                x2=rect.x2,
-                y2=rect.y2,
-            )
-        elif self.direction == Dir.Down:
+        delta = TRAJECTORY_DELTA.get(self.direction)
+        if delta:
+            dx1, dy1, dx2, dy2 = delta
             trajectory = Rect(
-                x1=rect.x1,
-                y1=rect.y1,
-                x2=rect.x2,
-                y2=rect.y2-Dir.Down.value.y,
+                x1=rect.x1+dx1,
+                y1=rect.y1+dy1,
+                x2=rect.x2+dx2,
+                y2=rect.y2+dy2,
             )
         else:
             trajectory = rect
+        if cache:
+            self._traj_cache = trajectory
         return trajectory
 
     @abc.abstractmethod
@@ -384,6 +412,8 @@ class Map(Renderable):
     """
     def __init__(self):
         self.data = []
+        self.mask = None
+        self._cell_cache = None
         self._lb = None
         self._lt = None
         self._rb = None
@@ -399,36 +429,37 @@ class Map(Renderable):
         self._lb = Vector2(0, len(self.data))
         self._rt = Vector2(len(self.data[0]), 0)
         self._rb = Vector2(len(self.data[0]), len(self.data))
+        # Frames start out blank, so only non-blank characters are kept.
+        self._cell_cache = np.array([
+            (x, y, ord(c), Color.White, Color.Default)
+            for y, line in enumerate(self.data)
+            for x, c in enumerate(line)
+            if not c.isspace()
+        ], dtype=np.int32).reshape(-1, 5)
+        # True where the map has an obstacle.
+        width = max(len(line) for line in self.data)
+        self.mask = np.array([
+            [not c.isspace() for c in line.ljust(width)]
+            for line in self.data
+        ], dtype=np.bool_)
 
     def render(self, tm=None, dx=0, dy=0):
-        cells = []
-        for y, line in enumerate(self.data):
-            for x, c in enumerate(line):
-                cell = Cell(x=x-dx, y=y-dy, fg=Color.White, c=ord(c))
-                cells.append(cell)
-
-        render(tm, cells)
+        render_array(tm, self._cell_cache - (dx, dy, 0, 0, 0))
 
     def intersectd_with(self, pos: Vector2=None, rect: Rect=None):
         """
         """
         if pos:
-            try:
-                v = self.data[pos.y][pos.x].strip()
-                if v:
-                    return True
-                else:
-                    return False
-            except IndexError:
+            height, width = self.mask.shape
+            if not (0 <= pos.x < width and 0 <= pos.y < height):
                 return True
+            return bool(self.mask[pos.y, pos.x])
         elif rect:
-            if self.intersectd_with(rect.lb) or \
-                self.intersectd_with(rect.lt) or \
-                self.intersectd_with(rect.rb) or \
-                self.intersectd_with(rect.rt):
+            height, width = self.mask.shape
+            if rect.x1 < 0 or rect.y1 < 0 or \
+                rect.x2 >= width or rect.y2 >= height:
                 return True
-            else:
-                return False
+            return bool(self.mask[rect.y1:rect.y2+1, rect.x1:rect.x2+1].any())
         else:
             pass
 
@@ -504,6 +535,14 @@ class MouseKey(enum.Enum):
     z = 'z'
 
 
+# Integer key code of each MouseKey, as termbox reports it in `key` for
+# special keys or as ord(uch) for characters.
+KEY_CODES = {
+    k: k.value if isinstance(k.value, int) else ord(k.value)
+    for k in MouseKey
+}
+
+
 class Terminal:
     """
     Terminal class.
@@ -516,6 +555,8 @@ class Terminal:
         self.map.load(os.path.join(mapdir, 'map.txt'))
         self._keydown_handlers = dict()
         self._on_shutdown = None
+        self.frame = None
+        self._prev_frame = None
 
     def close(self):
         self.tb.close()
@@ -527,12 +568,14 @@ class Terminal:
     def set_keydown_handler(self, keys, cb):
         if isinstance(keys, list):
             for key in keys:
-                self._keydown_handlers.update({key.value: cb})
+                self._keydown_handlers[KEY_CODES[key]] = cb
         else:
             key = keys
-            self._keydown_handlers.update({key.value: cb})
+            self._keydown_handlers[KEY_CODES[key]] = cb
 
     def get_keydown_handler(self, keyvalue):
+        if isinstance(keyvalue, str):
+            keyvalue = ord(keyvalue)
         return self._keydown_handlers.get(keyvalue)
 
     @property
@@ -566,14 +609,68 @@ class Terminal:
         """
         self.tb.clear()
 
+    def new_frame(self):
+        """
+        Start a blank frame. Cells are drawn into `frame` and only the
+        ones that differ from the previous frame reach termbox on flush().
+        """
+        shape = (self.height, self.width, 3)
+        if self._prev_frame is None or self._prev_frame.shape != shape:
+            # Termbox keeps its back buffer between presents, so it only
+            # needs clearing when the buffers are (re)allocated.
+            self.clear()
+            self._prev_frame = np.empty(shape, np.int32)
+            self._prev_frame[:] = BLANK_CELL
+            self.frame = np.empty(shape, np.int32)
+        self.frame[:] = BLANK_CELL
+
+    def change_cell(self, x, y, c, fg, bg):
+        height, width = self.frame.shape[:2]
+        if 0 <= x < width and 0 <= y < height:
+            self.frame[y, x] = (c, fg, bg)
+
+    def draw_hline(self, x0, x1, y, c, fg, bg):
+        """
+        Draw the same cell from x0 to x1 (inclusive) on row y.
+        """
+        height, width = self.frame.shape[:2]
+        if not 0 <= y < height:
+            return
+        x0 = max(x0, 0)
+        x1 = min(x1, width - 1)
+        if x0 <= x1:
+            self.frame[y, x0:x1+1] = (c, fg, bg)
+
+    def draw_array(self, cells):
+        """
+        Draw an (N, 5) array of x, y, c, fg, bg rows.
+        """
+        height, width = self.frame.shape[:2]
+        xs = cells[:, 0]
+        ys = cells[:, 1]
+        ok = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        self.frame[ys[ok], xs[ok]] = cells[ok, 2:]
+
+    def flush(self):
+        """
+        Send cells changed since the previous frame to termbox.
+        """
+        ys, xs = np.nonzero((self.frame != self._prev_frame).any(axis=2))
+        cells = self.frame[ys, xs].tolist()
+        change_cell = self.tb.change_cell
+        for x, y, (c, fg, bg) in zip(xs.tolist(), ys.tolist(), cells):
+            change_cell(x, y, c, fg, bg)
+        self.frame, self._prev_frame = self._prev_frame, self.frame
+
     def update(self, now, player, objects):
         """
         """
-        self.clear()
+        self.new_frame()
         self.peek_key_event()
         render_objects(self, [self.map])
         render_objects(self, objects)
         render_objects(self, [player])
+        self.flush()
         self.tb.present()
 
     def peek_key_event(self):
@@ -582,25 +679,18 @@ class Terminal:
                 raise RuntimeError('Null termbox')
 
             type_, uch, key, mod, w, h, x, y = self.tb.peek_event()
-            logger.debug('type:{type},uch={uch},key={key},mod={mod},w={w},h={h},x={x},y={y}'.format(
-                type=type_,
-                uch=uch,
-                key=key,
-                mod=mod,
-                w=w, h=h, x=x, y=y
-            ))
-            if key is not None:
-                cb = self.get_keydown_handler(key)
-                if cb:
-                    cb(key)
-                if key == KEY_ESC:
-                    self.close()
-                    if self.on_shutdown:
-                        self.on_shutdown()
-            if uch:
-                cb = self.get_keydown_handler(uch)
-                if cb:
-                    cb(key)
+            logger.debug(
+                'type:%s,uch=%s,key=%s,mod=%s,w=%s,h=%s,x=%s,y=%s',
+                type_, uch, key, mod, w, h, x, y
+            )
+            # Termbox reports characters in `uch` with `key` set to 0.
+            cb = self._keydown_handlers.get(key or (uch and ord(uch)))
+            if cb:
+                cb(key)
+            if key == KEY_ESC:
+                self.close()
+                if self.on_shutdown:
+                    self.on_shutdown()
 
         except TypeError as e:
             pass
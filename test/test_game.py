@@ -1,5 +1,6 @@
 import pytest
-from agario.game import GameObject
+from agario.game import GameObject, collide, spawn_enemies
+from agario.terminal import Rect, Dir
 
 
 def test_GameObject():
@@ -7,4 +8,40 @@ def test_GameObject():
 
 
 def test_collision():
-    pass
+    obj = GameObject(x=0, y=0)
+    assert collide(obj, GameObject(x=0, y=0))
+    assert not collide(obj, GameObject(x=1, y=0))
+
+    obj.set_size(3)
+    assert collide(obj, GameObject(x=1, y=1))
+    assert not collide(obj, GameObject(x=2, y=0))
+    assert not collide(obj, GameObject(x=0, y=-2))
+    assert collide(Rect(0, 0, 4, 2), GameObject(x=4, y=2))
+
+
+def test_spawn_enemies():
+    enemies = spawn_enemies(count=50, rect=Rect(2, 3, 10, 5))
+    assert len(enemies) == 50
+    for e in enemies:
+        assert 2 <= e.get_pos().x < 10
+        assert 3 <= e.get_pos().y < 5
+        assert isinstance(e.get_pos().x, int)
+
+
+def test_make_trajectory():
+    obj = GameObject(x=10, y=10)
+    rect = obj.make_trajectory()
+    assert (rect.x1, rect.y1, rect.x2, rect.y2) == (10, 10, 10, 10)
+
+    obj.move(Dir.Left)
+    rect = obj.make_trajectory()
+    assert (rect.x1, rect.y1, rect.x2, rect.y2) == (8, 10, 10, 10)
+
+    obj.move(Dir.Up)
+    rect = obj.make_trajectory()
+    assert (rect.x1, rect.y1, rect.x2, rect.y2) == (8, 9, 8, 10)
+
+    obj.move(Dir.Right)
+    obj.move(Dir.Down)
+    rect = obj.make_trajectory()
+    assert (rect.x1, rect.y1, rect.x2, rect.y2) == (10, 9, 10, 10)
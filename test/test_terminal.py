@@ -0,0 +1,18 @@
+import os
+import pytest
+from agario.terminal import Map, Rect, Vector2, mapdir
+
+
+def test_Map_intersectd_with():
+    m = Map()
+    m.load(os.path.join(mapdir, 'map.txt'))
+    assert m.intersectd_with(pos=Vector2(0, 0))
+    assert not m.intersectd_with(pos=Vector2(10, 10))
+    assert m.intersectd_with(pos=Vector2(-1, 10))
+    assert m.intersectd_with(pos=Vector2(10, len(m.data)))
+
+    assert not m.intersectd_with(rect=Rect(1, 1, 5, 5))
+    assert m.intersectd_with(rect=Rect(0, 1, 5, 5))
+    # An obstacle inside the rect but away from its corners.
+    m.mask[3, 3] = True
+    assert m.intersectd_with(rect=Rect(1, 1, 5, 5))